@@ -6,8 +6,16 @@ from fastapi_playground_poc.courses_routes import router as courses_router
 from fastapi_playground_poc.exception_handlers import register_exception_handlers
 from fastapi_playground_poc.config import settings
 from fastapi_playground_poc.startup import startup_event
+from fastapi_playground_poc.db import warm_up_pool, request_session, RequestSessionHolder
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
 import logging
 logging.basicConfig(level=logging.INFO)
+# Skip per-record thread/process id lookups in log records
+logging.logThreads = False
+logging.logProcesses = False
 logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -18,6 +26,18 @@ async def lifespan(app: FastAPI):
     if settings.environment != "test":
         await startup_event()
         logger.info("Migrations executed")
+        # Pre-warm the connection pool so the first requests don't pay
+        # connect+auth cost
+        await warm_up_pool()
+        logger.info("Connection pool warmed up")
+        # Redis-backed response cache for the read-heavy course endpoints
+        FastAPICache.init(
+            RedisBackend(aioredis.from_url(settings.redis_url)), prefix="fastapi-cache"
+        )
+        logger.info("Response cache initialized")
+    else:
+        # Tests exercise the real handlers; keep the decorator a pass-through
+        FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache", enable=False)
     yield
     logger.info("Application is stopping")
     # Shutdown: Add cleanup tasks here if needed in the future
@@ -35,6 +55,48 @@ app = FastAPI(
 # Register global exception handlers (FastAPI equivalent of Spring @ControllerAdvice)
 register_exception_handlers(app)
 
+# Share one lazily-created session across all @Transactional calls in a
+# request; no session (and no connection) is allocated for requests that
+# never touch the database
+@app.middleware("http")
+async def request_session_middleware(request, call_next):
+    holder = RequestSessionHolder()
+    token = request_session.set(holder)
+    try:
+        return await call_next(request)
+    finally:
+        request_session.reset(token)
+        if holder.session is not None:
+            await holder.session.close()
+
+
+# Dev-time N+1 detector: warn when a single request blows its statement budget
+QUERY_BUDGET_PER_REQUEST = 10
+
+if settings.environment.lower() in ("local", "dev"):
+    from fastapi_playground_poc.db import statement_counter, StatementCounter
+
+    @app.middleware("http")
+    async def query_budget_middleware(request, call_next):
+        # Mutable counter shared by reference with the cursor-execute
+        # listener; a plain-int ContextVar set in the handler's child task
+        # would never be visible here (see StatementCounter in db.py)
+        counter = StatementCounter()
+        token = statement_counter.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            statement_counter.reset(token)
+        if counter.count > QUERY_BUDGET_PER_REQUEST:
+            logger.warning(
+                "%s %s issued %d SQL statements (budget %d) - possible N+1",
+                request.method,
+                request.url.path,
+                counter.count,
+                QUERY_BUDGET_PER_REQUEST,
+            )
+        return response
+
 # Include user routes
 app.include_router(user_router, tags=["users"])
 
@@ -57,4 +119,13 @@ async def health_check():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools cut per-request event-loop and HTTP-parsing
+    # overhead; one worker per CPU (workers requires the import-string form)
+    uvicorn.run(
+        "fastapi_playground_poc.app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
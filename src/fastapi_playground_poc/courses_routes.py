@@ -1,9 +1,21 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+from typing import Annotated, Optional
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.coder import PickleCoder
+from fastapi_cache.decorator import cache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_playground_poc.db import get_db
+from fastapi_playground_poc.models.Course import Course
 from fastapi_playground_poc.services.course_service import CourseService
 from fastapi_playground_poc.schemas import (
     CourseCreate,
+    CourseListResponse,
     CourseUpdate,
     CourseResponse,
     CourseResponseWithUsers,
@@ -14,26 +26,119 @@ from fastapi_playground_poc.schemas import (
 router = APIRouter()
 
 
+def _response_etag(payload: str) -> str:
+    """Content hash used for If-None-Match revalidation on read endpoints."""
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def _params_key_builder(
+    func, namespace="", *, request=None, response=None, args=(), kwargs=None
+):
+    """Cache key from a loader's data parameters only.
+
+    The library's default key builder hashes the repr of every argument,
+    including the per-request CourseService instance whose repr embeds its
+    object address — no two requests would ever share a key. Only the
+    parameters that actually select the payload participate here, so keys
+    are stable across requests and worker processes."""
+    params = ",".join(
+        f"{name}={value}"
+        for name, value in sorted((kwargs or {}).items())
+        if name != "course_service"
+    )
+    return f"{namespace}:{func.__name__}({params})"
+
+
+# The @cache decorators live on these loaders rather than on the route
+# handlers: with no Request/Response parameter in sight the decorator leaves
+# HTTP headers alone, so it cannot overwrite the handlers' deterministic
+# blake2b ETags with its own per-process-salted W/{hash(...)} value.
+# PickleCoder round-trips the pydantic models as-is; the default JsonCoder
+# would hand back plain dicts on a hit.
+@cache(expire=30, namespace="courses", coder=PickleCoder, key_builder=_params_key_builder)
+async def _load_course(
+    course_id: int, course_service: CourseService
+) -> Optional[CourseResponseWithUsers]:
+    course = await course_service.get_course(course_id)
+    if course is None:
+        # Cached misses are fine: every mutation clears the namespace
+        return None
+    return CourseResponseWithUsers.model_validate(course)
+
+
+@cache(expire=30, namespace="courses", coder=PickleCoder, key_builder=_params_key_builder)
+async def _load_course_page(
+    limit: int, after_id: Optional[int], course_service: CourseService
+) -> CourseListResponse:
+    return await course_service.get_all_courses(limit=limit, after_id=after_id)
+
+
 # Course CRUD Operations
 @router.post("/course", response_model=CourseResponse)
 async def create_course(course_data: CourseCreate, course_service: CourseService = Depends()):
     """Create a new course"""
-    return await course_service.create_course(course_data)
+    course = await course_service.create_course(course_data)
+    await FastAPICache.clear(namespace="courses")
+    return course
 
 
 @router.get("/course/{course_id}", response_model=CourseResponseWithUsers)
-async def get_course(course_id: int, course_service: CourseService = Depends()):
+async def get_course(
+    course_id: int,
+    course_service: CourseService = Depends(),
+    request: Request = None,
+    response: Response = None,
+):
     """Get a course by ID with enrolled users"""
-    course = await course_service.get_course(course_id)
+    course = await _load_course(course_id=course_id, course_service=course_service)
     if course is None:
         raise HTTPException(status_code=404, detail="Course not found")
+    if request is not None:
+        # Let repeat clients revalidate instead of re-downloading the payload
+        etag = _response_etag(course.model_dump_json())
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        response.headers["ETag"] = etag
     return course
 
 
-@router.get("/courses", response_model=List[CourseResponse])
-async def get_all_courses(course_service: CourseService = Depends()):
-    """Get all courses"""
-    return await course_service.get_all_courses()
+@router.get("/courses", response_model=CourseListResponse)
+async def get_all_courses(
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    after_id: Optional[int] = None,
+    course_service: CourseService = Depends(),
+    request: Request = None,
+    response: Response = None,
+):
+    """Get a page of courses; pass the returned next_cursor as after_id to continue"""
+    page = await _load_course_page(
+        limit=limit, after_id=after_id, course_service=course_service
+    )
+    if request is not None:
+        etag = _response_etag(page.model_dump_json())
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        response.headers["ETag"] = etag
+    return page
+
+
+@router.get("/courses/stream")
+async def stream_all_courses(db: AsyncSession = Depends(get_db)):
+    """Stream all courses as a JSON array without materializing the whole table"""
+
+    async def generate():
+        stream = await db.stream_scalars(
+            select(Course).execution_options(yield_per=500)
+        )
+        yield "["
+        first = True
+        async for course in stream:
+            prefix = "" if first else ","
+            first = False
+            yield prefix + CourseResponse.model_validate(course).model_dump_json()
+        yield "]"
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @router.put("/course/{course_id}", response_model=CourseResponse)
@@ -44,6 +149,7 @@ async def update_course(
     course = await course_service.update_course(course_id, course_data)
     if course is None:
         raise HTTPException(status_code=404, detail="Course not found")
+    await FastAPICache.clear(namespace="courses")
     return course
 
 
@@ -53,6 +159,7 @@ async def delete_course(course_id: int, course_service: CourseService = Depends(
     deleted = await course_service.delete_course(course_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Course not found")
+    await FastAPICache.clear(namespace="courses")
     return {"message": f"Course {course_id} deleted successfully"}
 
 
@@ -66,6 +173,8 @@ async def enroll_user_in_course(
         enrollment = await course_service.enroll_user_in_course(user_id, course_id)
         if enrollment is None:
             raise HTTPException(status_code=404, detail="User or course not found")
+        # Enrollment changes the user list cached under /course/{id}
+        await FastAPICache.clear(namespace="courses")
         return enrollment
     except ValueError as e:
         error_message = str(e).lower()
@@ -79,6 +188,44 @@ async def enroll_user_in_course(
             raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/user/{user_id}/enroll", response_model=List[EnrollmentResponse])
+async def enroll_user_in_courses(
+    user_id: int, course_ids: List[int], course_service: CourseService = Depends()
+):
+    """Enroll a user in several courses in one request (duplicates are skipped)"""
+    try:
+        enrollments = await course_service.enroll_user_in_courses(user_id, course_ids)
+    except ValueError as e:
+        error_message = str(e).lower()
+        if "user not found" in error_message:
+            raise HTTPException(status_code=404, detail="User not found")
+        elif "course not found" in error_message:
+            raise HTTPException(status_code=404, detail="Course not found")
+        else:
+            raise HTTPException(status_code=400, detail=str(e))
+    await FastAPICache.clear(namespace="courses")
+    return enrollments
+
+
+@router.post("/course/{course_id}/enroll", response_model=List[EnrollmentResponse])
+async def bulk_enroll_users(
+    course_id: int, user_ids: List[int], course_service: CourseService = Depends()
+):
+    """Enroll several users in a course in one request (duplicates are skipped)"""
+    try:
+        enrollments = await course_service.bulk_enroll_users(course_id, user_ids)
+    except ValueError as e:
+        error_message = str(e).lower()
+        if "user not found" in error_message:
+            raise HTTPException(status_code=404, detail="User not found")
+        elif "course not found" in error_message:
+            raise HTTPException(status_code=404, detail="Course not found")
+        else:
+            raise HTTPException(status_code=400, detail=str(e))
+    await FastAPICache.clear(namespace="courses")
+    return enrollments
+
+
 @router.delete("/user/{user_id}/enroll/{course_id}")
 async def unenroll_user_from_course(
     user_id: int, course_id: int, course_service: CourseService = Depends()
@@ -87,22 +234,51 @@ async def unenroll_user_from_course(
     success = await course_service.unenroll_user_from_course(user_id, course_id)
     if not success:
         raise HTTPException(status_code=404, detail="Enrollment not found")
+    await FastAPICache.clear(namespace="courses")
     return {"message": f"User {user_id} unenrolled from course {course_id}"}
 
 
 @router.get("/user/{user_id}/courses", response_model=UserResponseWithCourses)
-async def get_user_courses(user_id: int, course_service: CourseService = Depends()):
+async def get_user_courses(
+    user_id: int,
+    course_service: CourseService = Depends(),
+    request: Request = None,
+):
     """Get a user with all their enrolled courses"""
     user_with_courses = await course_service.get_user_courses(user_id)
     if user_with_courses is None:
         raise HTTPException(status_code=404, detail="User not found")
+    if request is not None:
+        # One pydantic-core serialization pass; skip FastAPI's revalidation
+        return Response(
+            content=user_with_courses.model_dump_json(),
+            media_type="application/json",
+        )
     return user_with_courses
 
 
 @router.get("/course/{course_id}/users", response_model=CourseResponseWithUsers)
-async def get_course_users(course_id: int, course_service: CourseService = Depends()):
+async def get_course_users(
+    course_id: int,
+    course_service: CourseService = Depends(),
+    request: Request = None,
+    response: Response = None,
+):
     """Get a course with all enrolled users"""
     course_with_users = await course_service.get_course_users(course_id)
     if course_with_users is None:
         raise HTTPException(status_code=404, detail="Course not found")
+    if request is not None:
+        # Serialize once in pydantic-core and reuse the payload for both the
+        # ETag and the body; returning a Response skips FastAPI's second
+        # validation pass against the response_model
+        payload = course_with_users.model_dump_json()
+        etag = _response_etag(payload)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        return Response(
+            content=payload,
+            media_type="application/json",
+            headers={"ETag": etag},
+        )
     return course_with_users
@@ -0,0 +1,169 @@
+"""
+Buffered async-insert batcher for high-rate enrollment traffic.
+
+Each call to CourseService.enroll_user_in_course costs its own round-trips
+and commit. Under heavy contention (e.g. class registration opening), it is
+cheaper to buffer enrollment requests for a few milliseconds and flush them
+as one multi-row INSERT, amortizing round-trip, parse and commit costs
+across the whole batch.
+
+Usage:
+    batcher = EnrollmentBatcher()
+    await batcher.start()
+    ...
+    enrollment_id = await batcher.enroll(user_id, course_id)
+    ...
+    await batcher.stop()
+
+The batcher is opt-in: the regular enrollment endpoint keeps its simple
+one-request-one-transaction path.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select
+
+from fastapi_playground_poc.db import AsyncSessionLocal
+from fastapi_playground_poc.models.User import User
+from fastapi_playground_poc.models.Course import Course
+from fastapi_playground_poc.models.Enrollment import Enrollment
+
+logger = logging.getLogger(__name__)
+
+
+class EnrollmentBatcher:
+    """Coalesces concurrent enrollment requests into bulk INSERT batches."""
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        max_wait_time: float = 0.05,
+        max_rows: int = 500,
+    ):
+        self.session_factory = session_factory
+        self.max_wait_time = max_wait_time
+        self.max_rows = max_rows
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Flush any pending requests and stop the background loop."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        # Drain whatever is still queued so no caller hangs forever
+        await self._flush(self._drain())
+
+    async def enroll(self, user_id: int, course_id: int) -> int:
+        """
+        Queue an enrollment and wait for the batched insert to complete.
+
+        Returns the new enrollment id. Raises ValueError with the same
+        messages as CourseService.enroll_user_in_course on invalid input.
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((user_id, course_id, future))
+        return await future
+
+    def _drain(self) -> List[Tuple[int, int, asyncio.Future]]:
+        """Take everything currently queued, up to max_rows."""
+        batch = []
+        while not self._queue.empty() and len(batch) < self.max_rows:
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush_loop(self) -> None:
+        """Flush queued enrollments every max_wait_time seconds."""
+        while True:
+            await asyncio.sleep(self.max_wait_time)
+            batch = self._drain()
+            if batch:
+                try:
+                    await self._flush(batch)
+                except Exception:
+                    logger.exception("Enrollment batch flush failed")
+
+    async def _flush(self, batch: List[Tuple[int, int, asyncio.Future]]) -> None:
+        """Validate and insert one batch, resolving each caller's future."""
+        if not batch:
+            return
+
+        async with self.session_factory() as session:
+            try:
+                user_ids = {user_id for user_id, _, _ in batch}
+                course_ids = {course_id for _, course_id, _ in batch}
+
+                # One existence query per entity type for the whole batch
+                existing_users = set(
+                    (
+                        await session.execute(
+                            select(User.id).where(User.id.in_(user_ids))
+                        )
+                    ).scalars()
+                )
+                existing_courses = set(
+                    (
+                        await session.execute(
+                            select(Course.id).where(Course.id.in_(course_ids))
+                        )
+                    ).scalars()
+                )
+                already_enrolled = set(
+                    (
+                        await session.execute(
+                            select(Enrollment.user_id, Enrollment.course_id).where(
+                                Enrollment.user_id.in_(user_ids),
+                                Enrollment.course_id.in_(course_ids),
+                            )
+                        )
+                    ).all()
+                )
+
+                valid = []
+                for user_id, course_id, future in batch:
+                    if future.cancelled():
+                        continue
+                    if user_id not in existing_users:
+                        future.set_exception(ValueError("User not found"))
+                    elif course_id not in existing_courses:
+                        future.set_exception(ValueError("Course not found"))
+                    elif (user_id, course_id) in already_enrolled:
+                        future.set_exception(
+                            ValueError("User is already enrolled in the course")
+                        )
+                    else:
+                        valid.append((user_id, course_id, future))
+
+                if not valid:
+                    return
+
+                # Single multi-row INSERT for the whole batch; the column's
+                # server_default now() stamps enrollment_date on the DB clock
+                enrollments = [
+                    Enrollment(user_id=user_id, course_id=course_id)
+                    for user_id, course_id, _ in valid
+                ]
+                session.add_all(enrollments)
+                await session.commit()
+
+                for enrollment, (_, _, future) in zip(enrollments, valid):
+                    if not future.cancelled():
+                        future.set_result(enrollment.id)
+
+            except Exception as e:
+                await session.rollback()
+                for _, _, future in batch:
+                    if not future.done() and not future.cancelled():
+                        future.set_exception(e)
+                raise
@@ -18,7 +18,8 @@ logger = logging.getLogger(__name__)
 
 async def validation_exception_handler(request: Request, exc: ValidationError):
     """Handle Pydantic validation errors - return 400 Bad Request"""
-    logger.warning(f"Validation error on {request.url}: {exc}")
+    # %-style args defer formatting until the record passes the level filter
+    logger.warning("Validation error on %s: %s", request.url, exc)
     return JSONResponse(
         status_code=400,
         content={
@@ -31,7 +32,7 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
 
 async def integrity_error_handler(request: Request, exc: IntegrityError):
     """Handle SQLAlchemy IntegrityError - return 409 Conflict"""
-    logger.warning(f"Integrity constraint violation on {request.url}: {exc}")
+    logger.warning("Integrity constraint violation on %s: %s", request.url, exc)
     
     # Check if it's a duplicate key error (common pattern)
     error_msg = str(exc.orig) if exc.orig else str(exc)
@@ -51,7 +52,7 @@ async def integrity_error_handler(request: Request, exc: IntegrityError):
 
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTPException - preserve original status codes and details"""
-    logger.info(f"HTTP exception on {request.url}: {exc.status_code} - {exc.detail}")
+    logger.info("HTTP exception on %s: %s - %s", request.url, exc.status_code, exc.detail)
     return JSONResponse(
         status_code=exc.status_code,
         content={
@@ -63,7 +64,16 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions - return 500 Internal Server Error"""
-    logger.error(f"Unhandled exception on {request.url}: {type(exc).__name__}: {exc}", exc_info=True)
+    # Traceback formatting via exc_info is expensive; skip it entirely when
+    # ERROR records are filtered out
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Unhandled exception on %s: %s: %s",
+            request.url,
+            type(exc).__name__,
+            exc,
+            exc_info=True,
+        )
     return JSONResponse(
         status_code=500,
         content={
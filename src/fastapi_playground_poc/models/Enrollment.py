@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -19,7 +19,9 @@ class Enrollment(SqlBase):
         ForeignKey("courses.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
     )
-    enrollment_date = Column(DateTime, default=func.now(), nullable=False)
+    # server_default keeps the timestamp authoritative on the database and
+    # spares the client from marshalling one per insert
+    enrollment_date = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="enrollments", overlaps="courses,users")
@@ -27,7 +29,10 @@ class Enrollment(SqlBase):
         "Course", back_populates="enrollments", overlaps="courses,users"
     )
 
-    # Ensure a user can only enroll in a course once
+    # Ensure a user can only enroll in a course once; the unique constraint
+    # also backs the user-side join, while the extra composite index covers
+    # course-side lookups (get_course_users)
     __table_args__ = (
         UniqueConstraint("user_id", "course_id", name="unique_user_course_enrollment"),
+        Index("ix_enrollments_course_user", "course_id", "user_id"),
     )
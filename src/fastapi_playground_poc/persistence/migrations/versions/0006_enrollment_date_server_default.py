@@ -0,0 +1,41 @@
+"""Add server-side default now() to enrollment_date
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-08-31 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Let the database fill enrollment_date with now() when omitted."""
+    op.alter_column(
+        "enrollments",
+        "enrollment_date",
+        server_default=sa.func.now(),
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove the server-side default from enrollment_date."""
+    op.alter_column(
+        "enrollments",
+        "enrollment_date",
+        server_default=None,
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,34 @@
+"""Add composite index on enrollments(course_id, user_id)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-08-31 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index course-side enrollment lookups (get_course_users join)."""
+    # The unique_user_course_enrollment constraint already indexes
+    # (user_id, course_id); this covers the reverse access path.
+    op.create_index(
+        "ix_enrollments_course_user",
+        "enrollments",
+        ["course_id", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the course-side composite index."""
+    op.drop_index("ix_enrollments_course_user", table_name="enrollments")
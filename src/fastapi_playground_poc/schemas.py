@@ -67,6 +67,13 @@ class CourseResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CourseListResponse(BaseModel):
+    """Schema for a paginated page of courses"""
+
+    items: List[CourseResponse] = []
+    next_cursor: Optional[int] = None
+
+
 # Enrollment Schemas
 class EnrollmentCreate(BaseModel):
     """Schema for creating an enrollment"""
@@ -5,23 +5,101 @@ This service handles all course-related operations including enrollment manageme
 using the @Transactional decorator for automatic database transaction management.
 """
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, select, literal, delete, update, lambda_stmt
+from sqlalchemy.orm import joinedload, selectinload, raiseload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime
 
 from fastapi_playground_poc.transactional import Transactional
 from fastapi_playground_poc.models.Course import Course
 from fastapi_playground_poc.models.User import User
 from fastapi_playground_poc.models.Enrollment import Enrollment
-from fastapi_playground_poc.schemas import CourseCreate, CourseResponseWithUsers, CourseUpdate, UserInfoResponse, UserResponseWithCourses
+from fastapi_playground_poc.models.UserInfo import UserInfo
+from fastapi_playground_poc.schemas import (
+    CourseCreate,
+    CourseListResponse,
+    CourseResponse,
+    CourseResponseWithUsers,
+    CourseUpdate,
+    UserInfoResponse,
+    UserResponse,
+    UserResponseWithCourses,
+)
+
+
+# Statements hoisted to module scope: built once at import, every execution
+# hits SQLAlchemy's compiled cache with zero per-call construction work.
+_COURSE_BY_ID_STMT = select(Course).where(Course.id == bindparam("course_id"))
+
+_COURSE_PROJECTION_STMT = select(
+    Course.id, Course.name, Course.author_name, Course.price
+).where(Course.id == bindparam("course_id"))
+
+_USER_WITH_INFO_PROJECTION_STMT = (
+    select(
+        User.id,
+        User.name,
+        UserInfo.id.label("user_info_id"),
+        UserInfo.address,
+        UserInfo.bio,
+    )
+    .outerjoin(UserInfo, UserInfo.user_id == User.id)
+    .where(User.id == bindparam("user_id"))
+)
+
+_COURSES_FOR_USER_STMT = (
+    select(Course.id, Course.name, Course.author_name, Course.price)
+    .join(Enrollment, Enrollment.course_id == Course.id)
+    .where(Enrollment.user_id == bindparam("user_id"))
+)
+
+_USERS_FOR_COURSE_STMT = (
+    select(
+        User.id,
+        User.name,
+        UserInfo.id.label("user_info_id"),
+        UserInfo.address,
+        UserInfo.bio,
+    )
+    .join(Enrollment, Enrollment.user_id == User.id)
+    .outerjoin(UserInfo, UserInfo.user_id == User.id)
+    .where(Enrollment.course_id == bindparam("course_id"))
+)
+
+
+def _course_with_users_joined_stmt(course_id: int):
+    """Lambda-cached single-JOIN SELECT for one course with users and user_info.
+
+    For a single course the join fan-out is bounded by its enrollment count,
+    so one round-trip beats selectinload's three."""
+    stmt = lambda_stmt(
+        lambda: select(Course).options(
+            joinedload(Course.users).joinedload(User.user_info),
+            raiseload("*"),
+        )
+    )
+    stmt += lambda s: s.where(Course.id == course_id)
+    return stmt
+
+
 
 
 class CourseService:
     """Service class for course and enrollment operations with automatic transaction management."""
 
+    @staticmethod
+    async def _execute_on_own_connection(db: AsyncSession, stmt, params):
+        """Run a read-only statement on its own pool connection.
+
+        Lets independent SELECTs overlap via asyncio.gather; a session can
+        only run one statement at a time on its single connection."""
+        async with db.bind.connect() as connection:
+            return await connection.execute(stmt, params)
+
     # Course CRUD Operations
 
     @Transactional(auto_expunge=True)
@@ -34,224 +112,256 @@ class CourseService:
         )
 
         db.add(new_course)
-        await db.commit()
-
-        # Reload the course to get the ID
-        await db.refresh(new_course)
+        # Flush populates the ID via RETURNING; @Transactional commits
+        await db.flush()
         # db.expunge(new_course) Not needed with auto_expunge
         return new_course
 
-    @Transactional()
+    @Transactional(read_only=True)
     async def get_course(self, db: AsyncSession, course_id: int) -> Optional[Course]:
         """Get a course by ID with enrolled users."""
-        result = await db.execute(
-            select(Course).options(selectinload(Course.users).selectinload(User.user_info)).where(Course.id == course_id)
-        )
-        course = result.scalar_one_or_none()
-        
+        result = await db.execute(_course_with_users_joined_stmt(course_id))
+        course = result.unique().scalar_one_or_none()
+
         if course is None:
             return None
 
-        # Not needed with auto_expunge
-        # # Expunge from session to avoid DetachedInstanceError while keeping data
-        # db.expunge(course)
-        # for user in course.users:
-        #     db.expunge(user)
-        #     if user.user_info:
-        #         db.expunge(user.user_info)
-                
+        # auto_expunge detaches the whole graph with one expunge_all() at
+        # commit instead of walking course.users instance by instance
         return course
 
-    @Transactional(auto_expunge=True)
-    async def get_all_courses(self, db: AsyncSession) -> List[Course]:
-        """Get all courses."""
-        result = await db.execute(select(Course))
-        courses = result.scalars().all()
-        # db.expunge(courses) Not needed with auto_expunge
-        return list(courses)
+    @Transactional(auto_expunge=True, read_only=True)
+    async def get_all_courses(
+        self, db: AsyncSession, limit: int = 50, after_id: Optional[int] = None
+    ) -> CourseListResponse:
+        """Get a page of courses using keyset pagination."""
+        # Select plain columns instead of ORM entities; the rows are
+        # serialized immediately, so identity-map hydration is wasted work.
+        # Keyset pagination (id > after_id, LIMIT) keeps cost O(page_size)
+        # regardless of table size.
+        stmt = (
+            select(Course.id, Course.name, Course.author_name, Course.price)
+            .order_by(Course.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Course.id > after_id)
+
+        result = await db.execute(stmt)
+        items = [CourseResponse.model_construct(**row) for row in result.mappings()]
+        return CourseListResponse.model_construct(
+            items=items,
+            next_cursor=items[-1].id if items else None,
+        )
 
     @Transactional(auto_expunge=True)
     async def update_course(self, db: AsyncSession, course_id: int, course_data: CourseUpdate) -> Optional[Course]:
         """Update a course."""
-        # Get the existing course
-        result = await db.execute(select(Course).where(Course.id == course_id))
-        course = result.scalar_one_or_none()
-
-        if course is None:
-            return None
-
         # Update only provided fields
         update_data = course_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(course, field, value)
 
-        await db.commit()
-        await db.refresh(course)
-        # db.expunge(courses) Not needed with auto_expunge
-        return course
+        if not update_data:
+            # Nothing to change; just report whether the course exists
+            result = await db.execute(_COURSE_BY_ID_STMT, {"course_id": course_id})
+            return result.scalar_one_or_none()
+
+        # Single UPDATE ... RETURNING: not-found detection and the updated
+        # row come back in one round-trip; @Transactional commits
+        result = await db.execute(
+            update(Course)
+            .where(Course.id == course_id)
+            .values(**update_data)
+            .returning(Course)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalars().first()
 
     @Transactional(auto_expunge=True)
     async def delete_course(self, db: AsyncSession, course_id: int) -> bool:
         """Delete a course (and all its enrollments due to cascade)."""
-        # Get the existing course
-        result = await db.execute(select(Course).where(Course.id == course_id))
-        course = result.scalar_one_or_none()
-
-        if course is None:
-            return False
-
-        await db.delete(course)
-        await db.commit()
-        return True
+        # Single DELETE; rowcount doubles as the not-found check and the
+        # ON DELETE CASCADE foreign keys remove the enrollments in-database.
+        # @Transactional issues the single COMMIT at method exit
+        result = await db.execute(
+            delete(Course)
+            .where(Course.id == course_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
 
     # Enrollment Management
 
     @Transactional(auto_expunge=True)
     async def enroll_user_in_course(self, db: AsyncSession, user_id: int, course_id: int) -> Optional[Enrollment]:
         """Enroll a user in a course."""
-        # Check if user exists
-        user_result = await db.execute(select(User).where(User.id == user_id))
-        user = user_result.scalar_one_or_none()
-        if user is None:
-            raise ValueError("User not found")
+        # Insert straight away and let the FK constraints validate user and
+        # course: the happy path costs a single round-trip. Duplicates come
+        # back as a missing RETURNING row via ON CONFLICT DO NOTHING.
+        insert_fn = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+        try:
+            result = await db.execute(
+                insert_fn(Enrollment)
+                .values(user_id=user_id, course_id=course_id)
+                .on_conflict_do_nothing(index_elements=["user_id", "course_id"])
+                .returning(Enrollment)
+            )
+        except IntegrityError:
+            # FK violation (exceptional path): find out which side is
+            # missing with one diagnostic query after clearing the
+            # aborted transaction
+            await db.rollback()
+            existence_result = await db.execute(
+                select(literal("user").label("kind"))
+                .where(User.id == user_id)
+                .union_all(select(literal("course")).where(Course.id == course_id))
+            )
+            found = {row.kind for row in existence_result}
+            if "user" not in found:
+                raise ValueError("User not found")
+            if "course" not in found:
+                raise ValueError("Course not found")
+            raise
+
+        new_enrollment = result.scalars().first()
+        if new_enrollment is None:
+            raise ValueError("User is already enrolled in the course")
+        return new_enrollment
 
-        # Check if course exists
-        course_result = await db.execute(select(Course).where(Course.id == course_id))
-        course = course_result.scalar_one_or_none()
-        if course is None:
+    @Transactional(auto_expunge=True)
+    async def enroll_user_in_courses(
+        self, db: AsyncSession, user_id: int, course_ids: List[int]
+    ) -> List[Enrollment]:
+        """Enroll a user in several courses with one bulk INSERT."""
+        if not course_ids:
+            return []
+
+        # executemany parameters let SQLAlchemy page the rows through
+        # insertmanyvalues instead of one INSERT per course; duplicates are
+        # silently skipped via ON CONFLICT DO NOTHING
+        insert_fn = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+        try:
+            result = await db.execute(
+                insert_fn(Enrollment)
+                .on_conflict_do_nothing(index_elements=["user_id", "course_id"])
+                .returning(Enrollment),
+                [{"user_id": user_id, "course_id": course_id} for course_id in course_ids],
+            )
+        except IntegrityError:
+            # FK violation: report the missing side after clearing the
+            # aborted transaction
+            await db.rollback()
+            user_result = await db.execute(select(User.id).where(User.id == user_id))
+            if user_result.first() is None:
+                raise ValueError("User not found")
             raise ValueError("Course not found")
 
-        # Create enrollment
-        new_enrollment = Enrollment(
-            user_id=user_id,
-            course_id=course_id,
-            enrollment_date=datetime.utcnow(),
-        )
-        
+        return list(result.scalars().all())
+
+    @Transactional(auto_expunge=True)
+    async def bulk_enroll_users(
+        self, db: AsyncSession, course_id: int, user_ids: List[int]
+    ) -> List[Enrollment]:
+        """Enroll several users in one course with one bulk INSERT."""
+        if not user_ids:
+            return []
+
+        # Mirror of enroll_user_in_courses for roster imports: one
+        # executemany INSERT for the whole roster (the engine pages it via
+        # insertmanyvalues), duplicates skipped via ON CONFLICT DO NOTHING
+        insert_fn = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
         try:
-            db.add(new_enrollment)
-            await db.commit()
-            await db.refresh(new_enrollment)
-            # db.expunge(new_enrollment) // not needed if using auto_expunge
-            return new_enrollment
+            result = await db.execute(
+                insert_fn(Enrollment)
+                .on_conflict_do_nothing(index_elements=["user_id", "course_id"])
+                .returning(Enrollment),
+                [{"user_id": user_id, "course_id": course_id} for user_id in user_ids],
+            )
         except IntegrityError:
-            raise ValueError("User is already enrolled in the course")
+            # FK violation: report the missing side after clearing the
+            # aborted transaction
+            await db.rollback()
+            course_result = await db.execute(
+                _COURSE_PROJECTION_STMT, {"course_id": course_id}
+            )
+            if course_result.first() is None:
+                raise ValueError("Course not found")
+            raise ValueError("User not found")
+
+        return list(result.scalars().all())
 
     @Transactional(auto_expunge=True)
     async def unenroll_user_from_course(self, db: AsyncSession, user_id: int, course_id: int) -> bool:
         """Unenroll a user from a course."""
-        # Find the enrollment
+        # Delete and detect not-found in a single statement via RETURNING
         result = await db.execute(
-            select(Enrollment).where(
-                Enrollment.user_id == user_id, Enrollment.course_id == course_id
-            )
+            delete(Enrollment)
+            .where(Enrollment.user_id == user_id, Enrollment.course_id == course_id)
+            .returning(Enrollment.id)
         )
-        enrollment = result.scalar_one_or_none()
-
-        if enrollment is None:
-            return False
+        return result.scalar_one_or_none() is not None
 
-        # Delete the enrollment
-        await db.delete(enrollment)
-        await db.commit()
-        return True
-
-    @Transactional(auto_expunge=True)
+    @Transactional(auto_expunge=True, read_only=True)
     async def get_user_courses(self, db: AsyncSession, user_id: int) -> Optional[UserResponseWithCourses]:
         """Get a user with all their enrolled courses."""
-        # Get user first (without loading enrollments to avoid cache)
-        user_result = await db.execute(
-            select(User).options(selectinload(User.user_info)).where(User.id == user_id)
+        # Core column projections: rows arrive as plain mappings with no ORM
+        # hydration (no identity map, instance state or relationship loaders).
+        # The two SELECTs are independent, so they run concurrently on two
+        # pool connections: wall time ~max(t1, t2) instead of t1 + t2.
+        params = {"user_id": user_id}
+        user_result, course_result = await asyncio.gather(
+            self._execute_on_own_connection(db, _USER_WITH_INFO_PROJECTION_STMT, params),
+            self._execute_on_own_connection(db, _COURSES_FOR_USER_STMT, params),
         )
-        user = user_result.scalar_one_or_none()
+        user_row = user_result.mappings().first()
 
-        if user is None:
+        if user_row is None:
             return None
 
-        # Get courses through a fresh enrollment query (bypasses any cached relationships)
-        courses_result = await db.execute(
-            select(Course)
-            .join(Enrollment, Course.id == Enrollment.course_id)
-            .where(Enrollment.user_id == user_id)
-        )
-        courses = courses_result.scalars().all()
-        # Convert courses to dictionaries to avoid DetachedInstanceError
-        # courses_data = []
-        # for course in courses:
-        #     courses_data.append({
-        #         "id": course.id,
-        #         "name": course.name,
-        #         "author_name": course.author_name,
-        #         "price": course.price,
-        #     })
-
-        # Create response dict manually to include the courses
-        return UserResponseWithCourses(
-            id=user.id,
-            name=user.name,
-            user_info=UserInfoResponse(
-                id=user.user_info.id,
-                address=user.user_info.address,
-                bio=user.user_info.bio
-            ) if user.user_info else None,
-            courses=courses
+        # model_construct skips revalidation; the data just came from the DB
+        return UserResponseWithCourses.model_construct(
+            id=user_row["id"],
+            name=user_row["name"],
+            user_info=UserInfoResponse.model_construct(
+                id=user_row["user_info_id"],
+                address=user_row["address"],
+                bio=user_row["bio"],
+            ) if user_row["user_info_id"] is not None else None,
+            courses=[
+                CourseResponse.model_construct(**row)
+                for row in course_result.mappings()
+            ]
         )
-        # return {
-        #     "id": user.id,
-        #     "name": user.name,
-        #     "user_info": {
-        #         "id": user.user_info.id,
-        #         "address": user.user_info.address,
-        #         "bio": user.user_info.bio,
-        #     } if user.user_info else None,
-        #     "courses": courses_data,
-        # }
 
-    @Transactional(auto_expunge=True)
+    @Transactional(auto_expunge=True, read_only=True)
     async def get_course_users(self, db: AsyncSession, course_id: int) -> CourseResponseWithUsers:
         """Get a course with all enrolled users."""
-        # Get course first (without loading enrollments to avoid cache)
-        course_result = await db.execute(select(Course).where(Course.id == course_id))
-        course = course_result.scalar_one_or_none()
+        # Core column projections: rows arrive as plain mappings with no ORM
+        # hydration (no identity map, instance state or relationship loaders).
+        # Both SELECTs run concurrently on two pool connections; if the
+        # course turns out not to exist the second result is just discarded.
+        params = {"course_id": course_id}
+        course_result, user_result = await asyncio.gather(
+            self._execute_on_own_connection(db, _COURSE_PROJECTION_STMT, params),
+            self._execute_on_own_connection(db, _USERS_FOR_COURSE_STMT, params),
+        )
+        course_row = course_result.mappings().first()
 
-        if course is None:
+        if course_row is None:
             return None
 
-        # Get users through a fresh enrollment query (bypasses any cached relationships)
-        users_result = await db.execute(
-            select(User)
-            .options(selectinload(User.user_info))
-            .join(Enrollment, User.id == Enrollment.user_id)
-            .where(Enrollment.course_id == course_id)
-        )
-        users = users_result.scalars().all()
-
-        # Convert users to dictionaries to avoid DetachedInstanceError
-        users_data = []
-        for user in users:
-            users_data.append({
-                "id": user.id,
-                "name": user.name,
-                "user_info": {
-                    "id": user.user_info.id,
-                    "address": user.user_info.address,
-                    "bio": user.user_info.bio,
-                } if user.user_info else None,
-            })
-
-        return CourseResponseWithUsers(
-            id=course.id,
-            name=course.name,
-            author_name=course.author_name,
-            price=course.price,
-            users=users
-        )
-
-        # Create response dict manually to include the users
-        # return {
-        #     "id": course.id,
-        #     "name": course.name,
-        #     "author_name": course.author_name,
-        #     "price": course.price,
-        #     "users": users_data,
-        # }
\ No newline at end of file
+        # model_construct skips revalidation; the data just came from the DB
+        return CourseResponseWithUsers.model_construct(
+            **course_row,
+            users=[
+                UserResponse.model_construct(
+                    id=row["id"],
+                    name=row["name"],
+                    user_info=UserInfoResponse.model_construct(
+                        id=row["user_info_id"],
+                        address=row["address"],
+                        bio=row["bio"],
+                    ) if row["user_info_id"] is not None else None,
+                )
+                for row in user_result.mappings()
+            ]
+        )
\ No newline at end of file
@@ -8,12 +8,26 @@ for automatic database transaction management.
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
 
 from fastapi_playground_poc.transactional import Transactional
 from fastapi_playground_poc.models.User import User
 from fastapi_playground_poc.models.UserInfo import UserInfo
-from fastapi_playground_poc.schemas import UserCreate
+from fastapi_playground_poc.schemas import UserCreate, UserInfoResponse, UserResponse
+
+
+# Hoisted projection for the /users listing; one LEFT JOIN row per user
+_ALL_USERS_PROJECTION_STMT = (
+    select(
+        User.id,
+        User.name,
+        UserInfo.id.label("user_info_id"),
+        UserInfo.address,
+        UserInfo.bio,
+    )
+    .outerjoin(UserInfo, UserInfo.user_id == User.id)
+    .execution_options(yield_per=500)
+)
 
 
 class UserService:
@@ -32,34 +46,53 @@ class UserService:
         # With cascade="save-update", both objects will be saved automatically
         new_user.user_info = new_user_info
 
-        # Only need to add the parent object - cascade handles the rest
+        # Only need to add the parent object - cascade handles the rest.
+        # Flush populates the PKs; user_info is already the attached instance,
+        # so no reload SELECT is needed and @Transactional commits once
         db.add(new_user)
-        await db.commit()
-
-        # Load the user with the relationship properly for serialization
-        result = await db.execute(
-            select(User)
-            .options(selectinload(User.user_info))
-            .where(User.id == new_user.id)
-        )
-        user_with_info = result.scalar_one()
+        await db.flush()
 
-        return user_with_info
+        return new_user
 
-    @Transactional()
+    @Transactional(read_only=True)
     async def get_user(self, db: AsyncSession, user_id: int) -> Optional[User]:
         """Get a user by ID with user info."""
-        # Query for user by ID with user_info relationship
-        result = await db.execute(
-            select(User).options(selectinload(User.user_info)).where(User.id == user_id)
+        # session.get takes the PK fast path (no select() construction per
+        # call); populate_existing ensures the joinedload options are applied
+        # even when the row is already in the session's identity map, so
+        # user_info is always loaded for serialization
+        return await db.get(
+            User,
+            user_id,
+            options=(joinedload(User.user_info), raiseload("*")),
+            populate_existing=True,
         )
-        user = result.scalar_one_or_none()
-        return user
 
-    @Transactional()
-    async def get_all_users(self, db: AsyncSession) -> List[User]:
+    @Transactional(read_only=True)
+    async def get_all_users(self, db: AsyncSession) -> List[UserResponse]:
         """Get all users with user info."""
-        # Query for all users with user_info relationship
-        result = await db.execute(select(User).options(selectinload(User.user_info)))
-        users = result.scalars().all()
-        return list(users)
\ No newline at end of file
+        # Core projection instead of ORM entities: the rows exist only to be
+        # serialized, so skipping identity-map/InstanceState hydration saves
+        # per-row allocations. Streaming in fixed-size chunks keeps peak
+        # memory O(batch) and yields the event loop between partitions.
+        result = await db.stream(_ALL_USERS_PROJECTION_STMT)
+        users: List[UserResponse] = []
+        async for partition in result.mappings().partitions():
+            for row in partition:
+                # model_construct skips revalidation; the data just came
+                # from the DB
+                user_info_id = row["user_info_id"]
+                users.append(
+                    UserResponse.model_construct(
+                        id=row["id"],
+                        name=row["name"],
+                        user_info=None
+                        if user_info_id is None
+                        else UserInfoResponse.model_construct(
+                            id=user_info_id,
+                            address=row["address"],
+                            bio=row["bio"],
+                        ),
+                    )
+                )
+        return users
\ No newline at end of file
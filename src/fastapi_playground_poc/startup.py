@@ -2,8 +2,6 @@
 
 import asyncio
 import logging
-import os
-import subprocess
 import sys
 from pathlib import Path
 
@@ -11,54 +9,63 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent
 sys.path.insert(0, str(src_path))
 
-import subprocess
+from alembic import command
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
 from fastapi_playground_poc.config import settings
 logger = logging.getLogger(__name__)
 
 
 async def run_migrations() -> None:
-    """Run database migrations using alembic CLI."""
+    """Run database migrations in-process via the alembic API."""
     logger.info("Starting database migration check...")
-    
+
     try:
         # Get alembic working directory (persistence folder)
         alembic_dir = Path(__file__).parent / "persistence"
-        
+
         if not alembic_dir.exists():
             raise FileNotFoundError(f"Alembic directory not found at {alembic_dir}")
-        
-        # Set up environment variables for alembic
-        env = {
-            **dict(os.environ),
-            "DATABASE_URL": settings.database_url,
-        }
-        
-        # Run alembic upgrade using subprocess
-        def run_alembic_upgrade():
-            result = subprocess.run(
-                ["python", "-m", "alembic", "upgrade", "head"],
-                cwd=str(alembic_dir),  # Run from persistence directory
-                env=env,
-                # Don't capture output so logs appear directly in console
-                timeout=60  # 60 second timeout
+
+        config = Config(str(alembic_dir / "alembic.ini"))
+        config.set_main_option("sqlalchemy.url", settings.database_url)
+
+        # Skip the upgrade entirely when the database is already at head;
+        # a no-op startup then costs one SELECT instead of a full alembic run
+        head_revision = ScriptDirectory.from_config(config).get_current_head()
+        current_revision = await _get_current_revision()
+
+        if current_revision == head_revision:
+            logger.info(
+                f"Database already at head revision {head_revision}, skipping upgrade"
             )
-            return result
-        
-        # Run in executor to avoid blocking async event loop
+            return
+
+        # Run in executor to avoid blocking async event loop; calling the
+        # alembic API directly shares this interpreter's imports instead of
+        # paying a subprocess cold start
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, run_alembic_upgrade)
-        
-        if result.returncode != 0:
-            logger.error(f"Alembic upgrade failed with return code {result.returncode}")
-            raise subprocess.CalledProcessError(result.returncode, ["alembic", "upgrade", "head"])
-        
+        await loop.run_in_executor(None, command.upgrade, config, "head")
+
         logger.info("Database migrations completed successfully")
-        
+
     except Exception as e:
         logger.error(f"Failed to run migrations: {type(e).__name__}: {e}")
         raise RuntimeError("Database migrations failed - cannot start application") from e
 
 
+async def _get_current_revision():
+    """Read the alembic_version stamp through the app engine (None if unstamped)."""
+    from fastapi_playground_poc.db import engine
+
+    async with engine.connect() as connection:
+        return await connection.run_sync(
+            lambda conn: MigrationContext.configure(conn).get_current_revision()
+        )
+
+
 async def startup_event() -> None:
     """FastAPI startup event handler that runs migrations."""
     logger.info("Performing startup tasks...")
@@ -11,13 +11,11 @@ import inspect
 import logging
 from contextvars import ContextVar
 from enum import Enum
-from functools import wraps
 from typing import Optional, Type, List, Union, Any, AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import text
 
-from fastapi_playground_poc.db import get_db
+from fastapi_playground_poc.db import AsyncSessionLocal, request_session, schedule_session_close
 
 
 # Configure logging
@@ -43,12 +41,66 @@ class IsolationLevel(Enum):
 
 
 # Context variable to track current transaction state
-_transaction_context: ContextVar[Optional[dict]] = ContextVar('transaction_context', default=None)
+_transaction_context: ContextVar[Optional["TransactionContext"]] = ContextVar('transaction_context', default=None)
+
+
+# Signature introspection is pure-Python reflection and too slow for the
+# per-call path; resolve each function's injection point once and reuse it.
+_injection_index_cache: dict = {}
+
+
+def _injection_index(func) -> int:
+    """Return the positional index where the session is injected (cached)."""
+    try:
+        return _injection_index_cache[func]
+    except KeyError:
+        params = list(inspect.signature(func).parameters)
+        index = 1 if params and params[0] == 'self' else 0
+        _injection_index_cache[func] = index
+        return index
+
+
+
+def _light_wraps(func):
+    """functools.wraps without the __dict__ merge.
+
+    Copies only the attributes FastAPI introspection needs; the per-function
+    __dict__.update that wraps performs is skipped, which trims import-time
+    work and memory across the many decorated service methods."""
+    def apply(wrapper):
+        wrapper.__module__ = func.__module__
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        return wrapper
+    return apply
+
+
+
+# str(URL) rebuilds a formatted (password-masked) string on every call, so
+# the sqlite check is computed once per bind and cached. Keyed on the bind
+# rather than stored as a module flag because test sessions are bound to a
+# sqlite engine while the application engine is PostgreSQL.
+_bind_is_sqlite_cache: dict = {}
+
+
+def _bind_is_sqlite(bind) -> bool:
+    try:
+        return _bind_is_sqlite_cache[bind]
+    except KeyError:
+        is_sqlite = str(bind.url).startswith("sqlite")
+        _bind_is_sqlite_cache[bind] = is_sqlite
+        return is_sqlite
 
 
 class TransactionContext:
     """Manages the current transaction context and nesting level"""
 
+    # One context is built per transactional call; __slots__ skips the
+    # per-instance __dict__ allocation and keeps attribute access direct
+    __slots__ = ("session", "level", "savepoint_name", "is_rollback_only")
+
     def __init__(self, session: AsyncSession, level: int = 0, savepoint_name: Optional[str] = None):
         self.session = session
         self.level = level
@@ -85,17 +137,17 @@ def mark_rollback_only():
 
 class TransactionalError(Exception):
     """Base exception for transactional operations"""
-    pass
+    __slots__ = ()
 
 
 class TransactionRequiredError(TransactionalError):
     """Raised when MANDATORY propagation is used without existing transaction"""
-    pass
+    __slots__ = ()
 
 
 class TransactionNotAllowedError(TransactionalError):
     """Raised when NEVER propagation is used with existing transaction"""
-    pass
+    __slots__ = ()
 
 
 def Transactional(
@@ -117,17 +169,20 @@ def Transactional(
         timeout: Transaction timeout in seconds
         rollback_for: Exception types that should trigger rollback
         no_rollback_for: Exception types that should NOT trigger rollback
-        auto_expunge: Whether to automatically expunge all objects after transaction (default: True)
+        auto_expunge: Kept for API compatibility. When the decorator owns the
+            session, objects are detached by the session close that is
+            scheduled right after the transaction ends, so no separate
+            expunge pass is made (default: True)
 
     Usage:
         @Transactional()
         async def create_user(self, db: AsyncSession, user_data: UserCreate):
-            # Objects automatically expunged after transaction
+            # Objects detached when the owned session is closed
             pass
 
         @Transactional(auto_expunge=False)
         async def internal_helper(self, db: AsyncSession, user_id: int):
-            # Objects remain attached for performance within transaction scope
+            # Objects remain attached within the enclosing transaction scope
             pass
 
         @Transactional(propagation=Propagation.REQUIRES_NEW, read_only=True)
@@ -136,105 +191,199 @@ def Transactional(
             pass
     """
 
-    # Default rollback exceptions
-    if rollback_for is None:
-        rollback_for = [Exception]
-    if no_rollback_for is None:
-        no_rollback_for = []
+    # Default rollback exceptions; tuples let the exception path use single
+    # C-level isinstance calls instead of Python loops per raise
+    rollback_for = tuple(rollback_for) if rollback_for is not None else (Exception,)
+    no_rollback_for = tuple(no_rollback_for) if no_rollback_for is not None else ()
 
     def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Get function signature to determine injection point
-            sig = inspect.signature(func)
-            params = list(sig.parameters.keys())
-
-            # Check if this is a method (has 'self') or function
-            has_self = params and params[0] == 'self'
-            injection_index = 1 if has_self else 0
+        # Resolve the injection point once at decoration time; the wrapper
+        # then does zero signature introspection per call
+        injection_index = _injection_index(func)
+
+        # Bind the context-var lookup into the closure: a cell load is
+        # cheaper than the global + attribute lookup on every call
+        ctx_get = _transaction_context.get
+
+        # Fast path for the hottest configuration — REQUIRED with no
+        # isolation/read-only/timeout knobs — chosen once at decoration time
+        # so the per-call wrapper skips the whole propagation ladder
+        if (
+            propagation == Propagation.REQUIRED
+            and isolation_level is None
+            and not read_only
+            and timeout is None
+        ):
+            @_light_wraps(func)
+            async def fast_wrapper(*args, **kwargs):
+                current_context = ctx_get()
+                if current_context is None:
+                    return await _execute_in_new_transaction_fast(
+                        func, args, kwargs, injection_index,
+                        rollback_for, no_rollback_for, auto_expunge
+                    )
+                return await _execute_in_nested_transaction(
+                    func, args, kwargs, current_context,
+                    rollback_for, no_rollback_for, injection_index
+                )
 
-            # Get current transaction context
-            current_context = _transaction_context.get()
+            return fast_wrapper
 
-            # Handle propagation logic
-            if propagation == Propagation.MANDATORY:
+        # The remaining propagation modes are likewise resolved here, at
+        # decoration time: each gets its own wrapper so no Enum comparison
+        # ladder runs per call
+        if propagation == Propagation.MANDATORY:
+            @_light_wraps(func)
+            async def wrapper(*args, **kwargs):
+                current_context = ctx_get()
                 if not current_context:
                     raise TransactionRequiredError(
                         f"Transaction required for method {func.__name__} with MANDATORY propagation"
                     )
                 # Use existing transaction - inject session if needed
-                return await _inject_session_if_needed(func, args, kwargs, current_context.session)
+                return await _inject_session_if_needed(
+                    func, args, kwargs, current_context.session, injection_index
+                )
 
-            elif propagation == Propagation.NEVER:
-                if current_context:
+        elif propagation == Propagation.NEVER:
+            @_light_wraps(func)
+            async def wrapper(*args, **kwargs):
+                if ctx_get():
                     raise TransactionNotAllowedError(
                         f"Transaction not allowed for method {func.__name__} with NEVER propagation"
                     )
                 # Execute without transaction
                 return await func(*args, **kwargs)
 
-            elif propagation == Propagation.NOT_SUPPORTED:
-                if current_context:
+        elif propagation == Propagation.NOT_SUPPORTED:
+            @_light_wraps(func)
+            async def wrapper(*args, **kwargs):
+                if ctx_get():
                     # Suspend current transaction and execute without it
                     token = _transaction_context.set(None)
                     try:
                         return await func(*args, **kwargs)
                     finally:
                         _transaction_context.reset(token)
-                else:
-                    # No transaction, execute normally
-                    return await func(*args, **kwargs)
+                # No transaction, execute normally
+                return await func(*args, **kwargs)
 
-            elif propagation == Propagation.SUPPORTS:
+        elif propagation == Propagation.SUPPORTS:
+            @_light_wraps(func)
+            async def wrapper(*args, **kwargs):
+                current_context = ctx_get()
                 if current_context:
                     # Join existing transaction - inject session if needed
-                    return await _inject_session_if_needed(func, args, kwargs, current_context.session)
-                else:
-                    # No transaction, execute without one
-                    return await func(*args, **kwargs)
+                    return await _inject_session_if_needed(
+                        func, args, kwargs, current_context.session, injection_index
+                    )
+                # No transaction, execute without one
+                return await func(*args, **kwargs)
 
-            elif propagation == Propagation.REQUIRES_NEW:
+        elif propagation == Propagation.REQUIRES_NEW:
+            @_light_wraps(func)
+            async def wrapper(*args, **kwargs):
                 # Always create new transaction, even if one exists
                 return await _execute_in_new_transaction(
                     func, args, kwargs, injection_index,
                     isolation_level, read_only, timeout, rollback_for, no_rollback_for, auto_expunge
                 )
 
-            else:  # REQUIRED (default)
+        else:  # REQUIRED (default) with isolation/read-only/timeout options
+            @_light_wraps(func)
+            async def wrapper(*args, **kwargs):
+                current_context = ctx_get()
                 if current_context:
                     # Join existing transaction with savepoint for nested behavior
                     return await _execute_in_nested_transaction(
                         func, args, kwargs, current_context,
-                        rollback_for, no_rollback_for
-                    )
-                else:
-                    # Create new transaction
-                    return await _execute_in_new_transaction(
-                        func, args, kwargs, injection_index,
-                        isolation_level, read_only, timeout, rollback_for, no_rollback_for, auto_expunge
+                        rollback_for, no_rollback_for, injection_index
                     )
+                # Create new transaction
+                return await _execute_in_new_transaction(
+                    func, args, kwargs, injection_index,
+                    isolation_level, read_only, timeout, rollback_for, no_rollback_for, auto_expunge
+                )
 
         return wrapper
     return decorator
 
 
-async def _inject_session_if_needed(func, args, kwargs, session):
-    """Helper function to inject session into function arguments if needed"""
-    # Get function signature to determine injection point
-    sig = inspect.signature(func)
-    params = list(sig.parameters.keys())
+async def _execute_in_new_transaction_fast(
+        func, args, kwargs, injection_index, rollback_for, no_rollback_for, auto_expunge
+):
+    """REQUIRED-no-parent fast path without isolation/read-only/timeout branches."""
+
+    # Check if session already provided (avoid double injection)
+    if len(args) > injection_index and isinstance(args[injection_index], AsyncSession):
+        return await func(*args, **kwargs)
 
-    # Check if this is a method (has 'self') or function
-    has_self = params and params[0] == 'self'
-    injection_index = 1 if has_self else 0
+    # Reuse the per-request session when the middleware installed a holder;
+    # the middleware then owns the close. Only transactions without
+    # isolation/read-only options run here, so no connection characteristics
+    # leak between the calls sharing the session.
+    holder = request_session.get()
+    if holder is None:
+        session = AsyncSessionLocal()
+        owns_session = True
+    else:
+        session = holder.session
+        if session is None:
+            session = holder.session = AsyncSessionLocal()
+        owns_session = False
+
+    try:
+        context = TransactionContext(session, level=0)
+        token = _transaction_context.set(context)
+
+        try:
+            # Tuple arithmetic instead of list(args) + insert: one
+            # allocation, no element shifting (injection_index is 0 or 1)
+            new_args = (session,) + args if injection_index == 0 else (args[0], session) + args[1:]
+
+            result = await func(*new_args, **kwargs)
+
+            if not context.is_rollback_only:
+                await session.commit()
+            else:
+                await session.rollback()
+
+            # No explicit expunge: the close (scheduled below, or done by
+            # the middleware at end of request) detaches everything
+            if owns_session:
+                # Release the connection off the caller's critical path
+                schedule_session_close(session)
+            return result
+
+        except Exception as e:
+            if _should_rollback(e, rollback_for, no_rollback_for):
+                await session.rollback()
+            else:
+                await session.commit()
+            raise
+
+        finally:
+            _transaction_context.reset(token)
+
+    except BaseException:
+        # Error path keeps the awaited close (correctness over tail latency);
+        # request-scoped sessions are closed by the middleware instead
+        if owns_session:
+            await session.close()
+        raise
+
+
+async def _inject_session_if_needed(func, args, kwargs, session, injection_index=None):
+    """Helper function to inject session into function arguments if needed"""
+    if injection_index is None:
+        injection_index = _injection_index(func)
 
     # Check if session already provided (avoid double injection)
     if len(args) > injection_index and isinstance(args[injection_index], AsyncSession):
         return await func(*args, **kwargs)
     else:
-        # Inject session into function arguments
-        new_args = list(args)
-        new_args.insert(injection_index, session)
+        # Inject session into function arguments via tuple arithmetic
+        new_args = (session,) + args if injection_index == 0 else (args[0], session) + args[1:]
         return await func(*new_args, **kwargs)
 
 
@@ -248,33 +397,37 @@ async def _execute_in_new_transaction(
     if len(args) > injection_index and isinstance(args[injection_index], AsyncSession):
         return await func(*args, **kwargs)
 
-    # Create new session using existing get_db() function
-    db_generator = get_db()
-    session = await anext(db_generator)
+    # Create the session directly; routing it through the get_db() async
+    # generator cost an extra coroutine frame plus athrow/aclose teardown
+    # machinery on every transactional call
+    session = AsyncSessionLocal()
 
     try:
-        # Set isolation level if specified
+        # Apply isolation level / read-only as connection execution options
+        # at checkout instead of paying SET TRANSACTION round-trips
+        execution_options = {}
         if isolation_level:
             isolation_str = isolation_level.value if isinstance(isolation_level, IsolationLevel) else isolation_level
-            await session.execute(text(f"SET TRANSACTION ISOLATION LEVEL {isolation_str}"))
+            execution_options["isolation_level"] = isolation_str
 
-        # Set read-only mode if specified (skip for SQLite)
         if read_only:
-            # Check if we're using SQLite (which doesn't support SET TRANSACTION READ ONLY)
-            db_url = str(session.bind.url)
-            if not db_url.startswith('sqlite'):
-                await session.execute(text("SET TRANSACTION READ ONLY"))
+            # SQLite has no read-only transactions; on PostgreSQL the flag is
+            # a connection characteristic applied without an extra statement
+            if not _bind_is_sqlite(session.bind):
+                execution_options["postgresql_readonly"] = True
             else:
                 logger.debug("Skipping read-only mode for SQLite database")
 
+        if execution_options:
+            await session.connection(execution_options=execution_options)
+
         # Create transaction context
         context = TransactionContext(session, level=0)
         token = _transaction_context.set(context)
 
         try:
             # Inject session into function arguments
-            new_args = list(args)
-            new_args.insert(injection_index, session)
+            new_args = (session,) + args if injection_index == 0 else (args[0], session) + args[1:]
 
             # Execute function with timeout if specified
             if timeout:
@@ -287,23 +440,23 @@ async def _execute_in_new_transaction(
 
             # Commit if not marked for rollback
             if not context.is_rollback_only:
-                await session.commit()
-                logger.debug(f"Transaction committed for {func.__name__}")
+                if read_only:
+                    # Nothing to persist: skip the COMMIT round-trip and let
+                    # the pool roll the connection back at checkin
+                    logger.debug("Read-only transaction, commit skipped for %s", func.__name__)
+                else:
+                    await session.commit()
+                    logger.debug("Transaction committed for %s", func.__name__)
 
-                # Auto-expunge all objects after successful commit if enabled
-                if auto_expunge:
-                    session.expunge_all()
-                    logger.debug(f"All objects expunged after commit for {func.__name__}")
+                # No explicit expunge here: this call owns the session and
+                # the close scheduled below detaches every object anyway, so
+                # the extra identity-map walk would be pure duplicate work
             else:
                 await session.rollback()
-                logger.debug(f"Transaction rolled back (marked rollback-only) for {func.__name__}")
-
-                # Also expunge after rollback if auto_expunge is enabled
-                # This ensures consistency and prevents DetachedInstanceError
-                if auto_expunge:
-                    session.expunge_all()
-                    logger.debug(f"All objects expunged after rollback for {func.__name__}")
+                logger.debug("Transaction rolled back (marked rollback-only) for %s", func.__name__)
 
+            # Release the connection off the caller's critical path
+            schedule_session_close(session)
             return result
 
         except Exception as e:
@@ -311,115 +464,70 @@ async def _execute_in_new_transaction(
             should_rollback = _should_rollback(e, rollback_for, no_rollback_for)
 
             if should_rollback:
-                logger.debug(f"Rolling back transaction for {func.__name__} due to {type(e).__name__}")
-                # Trigger rollback through get_db() generator
-                try:
-                    await db_generator.athrow(type(e), e, e.__traceback__)
-                except StopAsyncIteration:
-                    pass
-
-                # Expunge after rollback if auto_expunge is enabled
-                if auto_expunge:
-                    session.expunge_all()
-                    logger.debug(f"All objects expunged after rollback for {func.__name__}")
+                logger.debug("Rolling back transaction for %s due to %s", func.__name__, type(e).__name__)
+                await session.rollback()
             else:
                 # Commit even though exception occurred
                 await session.commit()
-                logger.debug(f"Transaction committed for {func.__name__} despite {type(e).__name__}")
-
-                # Expunge after commit if auto_expunge is enabled
-                if auto_expunge:
-                    session.expunge_all()
-                    logger.debug(f"All objects expunged after commit for {func.__name__}")
+                logger.debug("Transaction committed for %s despite %s", func.__name__, type(e).__name__)
 
             raise
 
         finally:
             _transaction_context.reset(token)
 
-    finally:
-        # Properly close the generator by calling aclose()
-        await db_generator.aclose()
+    except BaseException:
+        # Error path keeps the awaited close (correctness over tail latency)
+        await session.close()
+        raise
 
 
 async def _execute_in_nested_transaction(
-        func, args, kwargs, parent_context, rollback_for, no_rollback_for
+        func, args, kwargs, parent_context, rollback_for, no_rollback_for,
+        injection_index=None
 ):
-    """Execute function in a nested transaction using savepoints"""
-
-    session = parent_context.session
-    savepoint_name = f"sp_{parent_context.level + 1}_{id(func)}"
+    """Execute function within the parent's transaction"""
 
     # For nested transactions, we'll reuse the existing session without savepoints for now
-    # This is a simpler approach that works better with test databases
-    logger.debug(f"Executing nested transaction for {func.__name__}")
+    # This is a simpler approach that works better with test databases.
+    # No new TransactionContext and no ContextVar set/reset either: the only
+    # state a nested call can change is the rollback-only flag, and
+    # mark_rollback_only() hits the parent context directly.
+    logger.debug("Executing nested transaction for %s", func.__name__)
 
-    # Create nested context but reuse the same session
-    nested_context = TransactionContext(
-        session,
-        level=parent_context.level + 1,
-        savepoint_name=savepoint_name
-    )
-    token = _transaction_context.set(nested_context)
+    if injection_index is None:
+        injection_index = _injection_index(func)
 
     try:
-        # Check if we need to inject session into args
-        # Get function signature to determine injection point
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
-
-        # Check if this is a method (has 'self') or function
-        has_self = params and params[0] == 'self'
-        injection_index = 1 if has_self else 0
-
         # Check if session already provided (avoid double injection)
         if len(args) > injection_index and isinstance(args[injection_index], AsyncSession):
-            result = await func(*args, **kwargs)
-        else:
-            # Inject session into function arguments
-            new_args = list(args)
-            new_args.insert(injection_index, session)
-            result = await func(*new_args, **kwargs)
-
-        # For nested transactions, we don't commit/rollback immediately
-        # Let the parent transaction handle it
-        if nested_context.is_rollback_only:
-            parent_context.mark_rollback_only()
-            logger.debug(f"Nested transaction marked parent for rollback: {func.__name__}")
+            return await func(*args, **kwargs)
 
-        # Note: For nested transactions, we don't expunge here since objects
-        # are still being used within the parent transaction context.
-        # Expunging will happen when the parent transaction completes.
+        # Inject the parent's session into the function arguments; commit,
+        # rollback and close all happen when the parent transaction completes
+        session = parent_context.session
+        new_args = (session,) + args if injection_index == 0 else (args[0], session) + args[1:]
+        return await func(*new_args, **kwargs)
 
-        return result
-        
     except Exception as e:
-        # Check if this exception should trigger rollback
-        should_rollback = _should_rollback(e, rollback_for, no_rollback_for)
-        
-        if should_rollback:
-            logger.debug(f"Nested transaction marking parent for rollback due to {type(e).__name__}")
+        if _should_rollback(e, rollback_for, no_rollback_for):
+            logger.debug("Nested transaction marking parent for rollback due to %s", type(e).__name__)
             parent_context.mark_rollback_only()
-        
+
         raise
-    
-    finally:
-        _transaction_context.reset(token)
 
 
-def _should_rollback(exception: Exception, rollback_for: List[Type[Exception]], no_rollback_for: List[Type[Exception]]) -> bool:
+def _should_rollback(exception: Exception, rollback_for, no_rollback_for) -> bool:
     """Determine if an exception should trigger a rollback"""
-    
-    # Check no_rollback_for first (takes precedence)
-    for exc_type in no_rollback_for:
-        if isinstance(exception, exc_type):
-            return False
-    
-    # Check rollback_for
-    for exc_type in rollback_for:
-        if isinstance(exception, exc_type):
-            return True
-    
+
+    # no_rollback_for takes precedence; a single C-level tuple isinstance
+    # replaces the old Python-level loops
+    if no_rollback_for and isinstance(exception, no_rollback_for):
+        return False
+
+    if isinstance(exception, rollback_for):
+        return True
+
     # Default behavior: rollback for any exception
     return True
 
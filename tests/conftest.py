@@ -12,6 +12,8 @@ import asyncio
 import contextlib
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
@@ -49,6 +51,17 @@ def set_test_environment():
     #     os.environ["ENVIRONMENT"] = original_env
 
 
+@pytest.fixture(scope="session", autouse=True)
+def init_response_cache():
+    """Initialize fastapi-cache disabled so @cache-decorated routes pass through.
+
+    FastAPICache.init is idempotent, so the lifespan init in app.py becomes a
+    no-op afterwards; this also covers tests that call route functions directly
+    without going through the app lifespan.
+    """
+    FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache", enable=False)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -318,7 +331,7 @@ def mock_transactional_db(test_db: AsyncSession):
     Fixture that provides a context manager for mocking @Transactional decorator.
     
     This centralizes the repetitive pattern of:
-    with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+    with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
         mock_get_db.side_effect = mock_get_db_factory(test_db)
         
     Usage:
@@ -329,8 +342,10 @@ def mock_transactional_db(test_db: AsyncSession):
     """
     @contextlib.contextmanager
     def mock_context():
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        # Deferred close is disabled because the fixture owns the shared session
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             yield
-    
+
     return mock_context()
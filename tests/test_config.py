@@ -6,113 +6,46 @@ specifically for testing with an in-memory SQLite database.
 Includes DDL Event Listener for consistent autoincrement behavior.
 """
 
-from sqlalchemy import pool, event, text
+from sqlalchemy import pool, event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 # Import the original Base from the main application
 from fastapi_playground_poc.db import Base
 
-# In-memory SQLite database URL for testing
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Shared-cache in-memory SQLite: every connection sees the same database,
+# so sessions don't have to be funneled through one StaticPool connection
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
 
-# Create async engine for testing
+# Create async engine for testing; NullPool gives each session its own
+# connection into the shared in-memory DB
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
-    poolclass=pool.StaticPool,
+    poolclass=pool.NullPool,
     connect_args={
         "check_same_thread": False,
     },
     echo=False,  # Set to True for SQL debugging
 )
 
+# Enforce foreign keys like PostgreSQL does (SQLite defaults to OFF), and
+# trade durability for speed — the database is throwaway test state
+@event.listens_for(test_engine.sync_engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 # Create async session factory for testing
 TestAsyncSessionLocal = sessionmaker(
     test_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
-# DDL Event Listener for consistent autoincrement behavior
-def add_sqlite_autoincrement(target, connection, **kw):
-    """
-    Modify SQLite tables to use AUTOINCREMENT for PostgreSQL-like behavior.
-    This ensures that deleted IDs are never reused, providing consistent
-    autoincrement behavior between SQLite (tests) and PostgreSQL (production).
-    """
-    if connection.dialect.name == "sqlite":
-        table_name = target.name
-
-        # Get current table structure
-        result = connection.execute(text(f"PRAGMA table_info({table_name})"))
-        columns = result.fetchall()
-
-        # Find the primary key column
-        pk_column = None
-        for col in columns:
-            if col[5]:  # col[5] is the pk flag
-                pk_column = col
-                break
-
-        if pk_column and pk_column[2].upper() == "INTEGER":  # col[2] is the type
-            # Rebuild table with AUTOINCREMENT
-            temp_table = f"{table_name}_temp"
-
-            # Rename original table
-            connection.execute(text(f"ALTER TABLE {table_name} RENAME TO {temp_table}"))
-
-            # Create new table with AUTOINCREMENT and constraints
-            if table_name == "enrollments":
-                # Special handling for enrollments table with unique constraint
-                create_sql = f"""
-                    CREATE TABLE {table_name} (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL,
-                        course_id INTEGER NOT NULL,
-                        enrollment_date DATETIME NOT NULL,
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE ON UPDATE CASCADE,
-                        FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE ON UPDATE CASCADE,
-                        CONSTRAINT unique_user_course_enrollment UNIQUE (user_id, course_id)
-                    )
-                """
-            elif table_name == "user_info":
-                # Special handling for user_info table with unique constraint
-                create_sql = f"""
-                    CREATE TABLE {table_name} (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL UNIQUE,
-                        address VARCHAR(255) NOT NULL,
-                        bio TEXT,
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON UPDATE CASCADE
-                    )
-                """
-            else:
-                # Generic table creation
-                create_sql = f"""
-                    CREATE TABLE {table_name} (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT
-                """
-
-                # Add other columns
-                for col in columns:
-                    if col[1] != "id":  # col[1] is the column name
-                        col_name = col[1]
-                        col_type = col[2]
-                        not_null = "NOT NULL" if col[3] else ""
-                        create_sql += f",\n                        {col_name} {col_type} {not_null}"
-
-                create_sql += "\n                    )"
-
-            connection.execute(text(create_sql))
-
-            # Copy data from temp table
-            connection.execute(
-                text(f"INSERT INTO {table_name} SELECT * FROM {temp_table}")
-            )
-
-            # Drop temp table
-            connection.execute(text(f"DROP TABLE {temp_table}"))
-
-
 async def get_test_db():
     """Dependency to get test database session"""
     async with TestAsyncSessionLocal() as session:
@@ -122,23 +55,46 @@ async def get_test_db():
             await session.close()
 
 
+# A shared-cache in-memory DB lives only while at least one connection is
+# open; this keep-alive connection pins it for the test session
+_keepalive_connection = None
+
+# DDL is paid once per process; repeated fixture entry skips the create_all
+_schema_created = False
+
+
 async def create_test_tables():
-    """Create all test tables in the in-memory database using original models"""
+    """Create all test tables in the in-memory database using original models.
+
+    Idempotent: the schema is created once per process and later calls are
+    no-ops, so every fixture can depend on it without re-running DDL."""
     # Import original models to ensure they're registered
     from fastapi_playground_poc.models.User import User
     from fastapi_playground_poc.models.UserInfo import UserInfo
     from fastapi_playground_poc.models.Course import Course
     from fastapi_playground_poc.models.Enrollment import Enrollment
 
-    # Register DDL event listeners for consistent autoincrement behavior
-    for model in [User, UserInfo, Course, Enrollment]:
-        event.listen(model.__table__, "after_create", add_sqlite_autoincrement)
+    global _keepalive_connection, _schema_created
+    if _keepalive_connection is None:
+        _keepalive_connection = await test_engine.connect()
+
+    if _schema_created:
+        return
+
+    # Emit INTEGER PRIMARY KEY AUTOINCREMENT directly in the CREATE TABLE so
+    # deleted ids are never reused (PostgreSQL-like behavior) without the old
+    # per-table rename/copy/drop rebuild after creation
+    for table in Base.metadata.tables.values():
+        table.dialect_options["sqlite"]["autoincrement"] = True
 
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    _schema_created = True
 
 
 async def drop_test_tables():
     """Drop all test tables from the in-memory database"""
+    global _schema_created
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    _schema_created = False
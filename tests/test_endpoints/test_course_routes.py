@@ -108,8 +108,9 @@ class TestCourseEndpoints:
 
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) == 0
+        assert isinstance(data["items"], list)
+        assert len(data["items"]) == 0
+        assert data["next_cursor"] is None
 
     @pytest.mark.unit
     def test_get_all_courses_with_data(self, test_client: TestClient, multiple_courses, mock_transactional_db):
@@ -120,11 +121,11 @@ class TestCourseEndpoints:
         assert response.status_code == 200
         data = response.json()
 
-        assert isinstance(data, list)
-        assert len(data) == len(multiple_courses)
+        assert isinstance(data["items"], list)
+        assert len(data["items"]) == len(multiple_courses)
 
         # Verify all courses are returned
-        for course_data in data:
+        for course_data in data["items"]:
             assert "id" in course_data
             assert "name" in course_data
             assert "author_name" in course_data
@@ -613,8 +614,8 @@ class TestCourseRoutesCoverageEnhancement:
         
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
+        assert isinstance(data["items"], list)
+        assert len(data["items"]) > 0
         # This hits lines 61-62 (return courses)
 
     @pytest.mark.parametrize("update_data,expected_status", [
@@ -867,8 +868,8 @@ class TestCourseRoutesCoverageEnhancement:
         
         assert result.status_code == 200
         data = result.json()
-        assert isinstance(data, list)
-        assert len(data) == 0
+        assert isinstance(data["items"], list)
+        assert len(data["items"]) == 0
 
     @pytest.mark.unit
     def test_get_all_courses_with_data_alt(self, test_client, multiple_courses, mock_transactional_db):
@@ -878,11 +879,11 @@ class TestCourseRoutesCoverageEnhancement:
         
         assert result.status_code == 200
         data = result.json()
-        assert isinstance(data, list)
-        assert len(data) == len(multiple_courses)
-        
+        assert isinstance(data["items"], list)
+        assert len(data["items"]) == len(multiple_courses)
+
         # Verify all courses have proper data
-        for course in data:
+        for course in data["items"]:
             assert "name" in course
             assert "author_name" in course
             assert "price" in course
@@ -1128,8 +1129,8 @@ class TestCourseRoutesCoverageEnhancement:
             
         assert result.status_code == 200
         data = result.json()
-        assert isinstance(data, list)
-        assert len(data) == len(multiple_courses)
+        assert isinstance(data["items"], list)
+        assert len(data["items"]) == len(multiple_courses)
 
     @pytest.mark.unit
     def test_update_course_direct_route_success(self, test_client, sample_course, mock_transactional_db):
@@ -1419,3 +1420,177 @@ class TestCourseRoutesCoverageEnhancement:
                 data = response.json()
                 assert "detail" in data
                 assert "Some other error" in data["detail"]
+
+
+class TestETagRevalidation:
+    """Test ETag / If-None-Match handling on the course read endpoints."""
+
+    @pytest.mark.unit
+    def test_get_course_returns_etag(self, test_client: TestClient, sample_course, mock_transactional_db):
+        """Test that GET /course/{id} responses carry an ETag header."""
+        with mock_transactional_db:
+            response = test_client.get(f"/course/{sample_course.id}")
+
+        assert response.status_code == 200
+        assert "etag" in response.headers
+
+    @pytest.mark.unit
+    def test_get_course_if_none_match_304(self, test_client: TestClient, sample_course, mock_transactional_db):
+        """Test that a matching If-None-Match returns 304 with no body."""
+        with mock_transactional_db:
+            first = test_client.get(f"/course/{sample_course.id}")
+            etag = first.headers["etag"]
+            second = test_client.get(
+                f"/course/{sample_course.id}", headers={"If-None-Match": etag}
+            )
+
+        assert second.status_code == 304
+        assert second.content == b""
+
+    @pytest.mark.unit
+    def test_get_all_courses_etag_changes_with_data(self, test_client: TestClient, sample_course, mock_transactional_db):
+        """Test that the /courses ETag changes when the data changes."""
+        with mock_transactional_db:
+            first = test_client.get("/courses")
+            etag = first.headers["etag"]
+
+            test_client.post(
+                "/course",
+                json={"name": "New", "author_name": "Author", "price": "10.00"},
+            )
+            second = test_client.get("/courses", headers={"If-None-Match": etag})
+
+        assert second.status_code == 200
+        assert second.headers["etag"] != etag
+
+
+class TestBatchEnrollmentEndpoint:
+    """Test the batch enrollment endpoint."""
+
+    @pytest.mark.unit
+    def test_batch_enroll_success(self, test_client: TestClient, sample_user, multiple_courses, mock_transactional_db):
+        """Test enrolling a user in several courses with one request."""
+        course_ids = [course.id for course in multiple_courses]
+        with mock_transactional_db:
+            response = test_client.post(
+                f"/user/{sample_user.id}/enroll", json=course_ids
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == len(multiple_courses)
+        assert {enrollment["course_id"] for enrollment in data} == set(course_ids)
+        for enrollment in data:
+            assert enrollment["user_id"] == sample_user.id
+
+    @pytest.mark.unit
+    def test_batch_enroll_skips_duplicates(self, test_client: TestClient, sample_enrollment, multiple_courses, mock_transactional_db):
+        """Test that already-enrolled courses are skipped, not errors."""
+        user = sample_enrollment.user
+        course_ids = [sample_enrollment.course_id] + [
+            course.id for course in multiple_courses
+        ]
+        with mock_transactional_db:
+            response = test_client.post(f"/user/{user.id}/enroll", json=course_ids)
+
+        assert response.status_code == 200
+        data = response.json()
+        # The pre-existing enrollment is skipped; only the new rows come back
+        assert len(data) == len(multiple_courses)
+
+    @pytest.mark.unit
+    def test_batch_enroll_user_not_found(self, test_client: TestClient, multiple_courses, mock_transactional_db):
+        """Test batch enrollment with non-existent user."""
+        course_ids = [course.id for course in multiple_courses]
+        with mock_transactional_db:
+            response = test_client.post("/user/99999/enroll", json=course_ids)
+
+        assert response.status_code == 404
+        assert "User not found" in response.json()["detail"]
+
+    @pytest.mark.unit
+    def test_batch_enroll_empty_list(self, test_client: TestClient, sample_user, mock_transactional_db):
+        """Test batch enrollment with an empty course list."""
+        with mock_transactional_db:
+            response = test_client.post(f"/user/{sample_user.id}/enroll", json=[])
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestBulkEnrollUsersEndpoint:
+    """Test the course-side bulk enrollment endpoint."""
+
+    @pytest.mark.unit
+    def test_bulk_enroll_success(self, test_client: TestClient, sample_course, multiple_users, mock_transactional_db):
+        """Test enrolling several users in a course with one request."""
+        user_ids = [user.id for user in multiple_users]
+        with mock_transactional_db:
+            response = test_client.post(
+                f"/course/{sample_course.id}/enroll", json=user_ids
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == len(multiple_users)
+        assert {enrollment["user_id"] for enrollment in data} == set(user_ids)
+        for enrollment in data:
+            assert enrollment["course_id"] == sample_course.id
+
+    @pytest.mark.unit
+    def test_bulk_enroll_skips_duplicates(self, test_client: TestClient, sample_enrollment, multiple_users, mock_transactional_db):
+        """Test that already-enrolled users are skipped, not errors."""
+        user_ids = [sample_enrollment.user_id] + [user.id for user in multiple_users]
+        with mock_transactional_db:
+            response = test_client.post(
+                f"/course/{sample_enrollment.course_id}/enroll", json=user_ids
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        # The pre-existing enrollment is skipped; only the new rows come back
+        assert len(data) == len(multiple_users)
+
+    @pytest.mark.unit
+    def test_bulk_enroll_course_not_found(self, test_client: TestClient, multiple_users, mock_transactional_db):
+        """Test bulk enrollment with non-existent course."""
+        user_ids = [user.id for user in multiple_users]
+        with mock_transactional_db:
+            response = test_client.post("/course/99999/enroll", json=user_ids)
+
+        assert response.status_code == 404
+        assert "Course not found" in response.json()["detail"]
+
+    @pytest.mark.unit
+    def test_bulk_enroll_empty_list(self, test_client: TestClient, sample_course, mock_transactional_db):
+        """Test bulk enrollment with an empty user list."""
+        with mock_transactional_db:
+            response = test_client.post(f"/course/{sample_course.id}/enroll", json=[])
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestStreamCoursesEndpoint:
+    """Test the streaming courses endpoint."""
+
+    @pytest.mark.unit
+    def test_stream_all_courses_empty(self, test_client: TestClient):
+        """Test streaming courses when no courses exist."""
+        response = test_client.get("/courses/stream")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data == []
+
+    @pytest.mark.unit
+    def test_stream_all_courses_multiple(self, test_client: TestClient, multiple_courses):
+        """Test streaming courses returns every course as valid JSON."""
+        response = test_client.get("/courses/stream")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == len(multiple_courses)
+        names = {course["name"] for course in data}
+        for course in multiple_courses:
+            assert course.name in names
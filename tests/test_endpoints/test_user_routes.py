@@ -26,7 +26,8 @@ class TestUserEndpoints:
             "bio": "Software engineer with 5 years experience",
         }
 
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.post("/user", json=user_data)
@@ -57,7 +58,8 @@ class TestUserEndpoints:
             # bio is optional
         }
 
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.post("/user", json=user_data)
@@ -87,7 +89,8 @@ class TestUserEndpoints:
         """Test retrieving a user by ID."""
         user_id = sample_user.id
 
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.get(f"/user/{user_id}")
@@ -105,7 +108,8 @@ class TestUserEndpoints:
         """Test retrieving a non-existent user."""
         non_existent_id = 99999
 
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.get(f"/user/{non_existent_id}")
@@ -118,7 +122,8 @@ class TestUserEndpoints:
     @pytest.mark.unit
     def test_get_all_users_empty(self, test_client: TestClient, test_db):
         """Test retrieving all users when database is empty."""
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.get("/users")
@@ -131,7 +136,8 @@ class TestUserEndpoints:
     @pytest.mark.unit
     def test_get_all_users_with_data(self, test_client: TestClient, multiple_users, test_db):
         """Test retrieving all users when users exist."""
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.get("/users")
@@ -152,7 +158,8 @@ class TestUserEndpoints:
     @pytest.mark.unit
     def test_get_all_users_single_user(self, test_client: TestClient, sample_user, test_db):
         """Test retrieving all users with a single user."""
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.get("/users")
@@ -173,7 +180,8 @@ class TestUserEndpoints:
             "bio": "Testing cascade behavior",
         }
 
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             # Create user
@@ -199,7 +207,8 @@ class TestUserEndpoints:
             "bio": "Testing data types",
         }
 
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.post("/user", json=user_data)
@@ -226,7 +235,8 @@ class TestUserEndpoints:
             "bio": "Bio with émojis 🚀 and special chars: @#$%^&*()",
         }
 
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db, \
+                patch('fastapi_playground_poc.transactional.schedule_session_close', lambda session: None):
             mock_get_db.side_effect = mock_get_db_factory(test_db)
             
             response = test_client.post("/user", json=user_data)
@@ -0,0 +1,87 @@
+"""
+Tests for the EnrollmentBatcher buffered insert path.
+
+Verifies that queued enrollments are flushed as a batch, that validation
+errors match the CourseService error messages, and that duplicates are
+rejected.
+"""
+
+import asyncio
+import pytest
+
+from sqlalchemy import select, func
+
+from fastapi_playground_poc.enrollment_batcher import EnrollmentBatcher
+from fastapi_playground_poc.models.Enrollment import Enrollment
+from tests.test_config import TestAsyncSessionLocal
+
+
+class TestEnrollmentBatcher:
+    """Test the buffered enrollment batcher against the test database."""
+
+    @pytest.mark.unit
+    async def test_batched_enrollments_are_inserted(self, test_db, multiple_users, sample_course):
+        """Concurrent enrollments are flushed as one batch and all succeed."""
+        batcher = EnrollmentBatcher(
+            session_factory=TestAsyncSessionLocal, max_wait_time=0.01
+        )
+        await batcher.start()
+        try:
+            enrollment_ids = await asyncio.gather(
+                *(batcher.enroll(user.id, sample_course.id) for user in multiple_users)
+            )
+        finally:
+            await batcher.stop()
+
+        assert len(enrollment_ids) == len(multiple_users)
+        assert len(set(enrollment_ids)) == len(multiple_users)
+
+        count = (
+            await test_db.execute(
+                select(func.count()).select_from(Enrollment).where(
+                    Enrollment.course_id == sample_course.id
+                )
+            )
+        ).scalar_one()
+        assert count == len(multiple_users)
+
+    @pytest.mark.unit
+    async def test_nonexistent_user_raises_value_error(self, test_db, sample_course):
+        """Enrolling an unknown user fails with the service's error message."""
+        batcher = EnrollmentBatcher(
+            session_factory=TestAsyncSessionLocal, max_wait_time=0.01
+        )
+        await batcher.start()
+        try:
+            with pytest.raises(ValueError, match="User not found"):
+                await batcher.enroll(99999, sample_course.id)
+        finally:
+            await batcher.stop()
+
+    @pytest.mark.unit
+    async def test_nonexistent_course_raises_value_error(self, test_db, sample_user):
+        """Enrolling into an unknown course fails with the service's error message."""
+        batcher = EnrollmentBatcher(
+            session_factory=TestAsyncSessionLocal, max_wait_time=0.01
+        )
+        await batcher.start()
+        try:
+            with pytest.raises(ValueError, match="Course not found"):
+                await batcher.enroll(sample_user.id, 99999)
+        finally:
+            await batcher.stop()
+
+    @pytest.mark.unit
+    async def test_duplicate_enrollment_rejected(self, test_db, sample_enrollment):
+        """An already-enrolled pair is rejected without failing the batch."""
+        batcher = EnrollmentBatcher(
+            session_factory=TestAsyncSessionLocal, max_wait_time=0.01
+        )
+        await batcher.start()
+        try:
+            with pytest.raises(ValueError, match="already enrolled"):
+                await batcher.enroll(
+                    sample_enrollment.user_id, sample_enrollment.course_id
+                )
+        finally:
+            await batcher.stop()
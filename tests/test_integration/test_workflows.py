@@ -318,7 +318,7 @@ class TestCompleteWorkflows:
             # Get course data from different endpoints
             course_direct = test_client.get(f"/course/{course_id}").json()
             course_from_users = test_client.get(f"/course/{course_id}/users").json()
-            courses_list = test_client.get("/courses").json()
+            courses_list = test_client.get("/courses").json()["items"]
             course_from_list = next(c for c in courses_list if c["id"] == course_id)
 
             # Verify course data consistency
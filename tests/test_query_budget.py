@@ -0,0 +1,91 @@
+"""
+Query-count regression tests.
+
+These lock in the statement counts of the relationship read paths so an
+accidental return to lazy loading (N+1) fails the suite instead of silently
+regressing latency. Uses a before_cursor_execute listener on the test engine.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from fastapi_playground_poc.services.course_service import CourseService
+from tests.test_config import test_engine
+
+
+@pytest.fixture
+def executed_statements():
+    """Record every statement sent to the test database during the test."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+
+def _selects(statements):
+    return [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+class TestQueryBudgets:
+    """Assert the per-call statement budgets of the hot read paths."""
+
+    def setup_method(self):
+        self.course_service = CourseService()
+
+    @pytest.mark.unit
+    async def test_get_course_users_statement_budget(
+        self, sample_enrollment, mock_transactional_db, executed_statements
+    ):
+        """get_course_users: course projection + joined users projection."""
+        with mock_transactional_db:
+            executed_statements.clear()
+            result = await self.course_service.get_course_users(
+                sample_enrollment.course_id
+            )
+
+        assert result is not None
+        assert len(_selects(executed_statements)) == 2
+
+    @pytest.mark.unit
+    async def test_get_user_courses_statement_budget(
+        self, sample_enrollment, mock_transactional_db, executed_statements
+    ):
+        """get_user_courses: user+user_info projection + courses projection."""
+        with mock_transactional_db:
+            executed_statements.clear()
+            result = await self.course_service.get_user_courses(
+                sample_enrollment.user_id
+            )
+
+        assert result is not None
+        assert len(_selects(executed_statements)) == 2
+
+    @pytest.mark.unit
+    async def test_get_course_statement_budget(
+        self, sample_enrollment, mock_transactional_db, executed_statements
+    ):
+        """get_course joins users and user_info in a single SELECT."""
+        with mock_transactional_db:
+            executed_statements.clear()
+            result = await self.course_service.get_course(
+                sample_enrollment.course_id
+            )
+
+        assert result is not None
+        assert len(_selects(executed_statements)) == 1
+
+    @pytest.mark.unit
+    async def test_get_all_courses_statement_budget(
+        self, multiple_courses, mock_transactional_db, executed_statements
+    ):
+        """get_all_courses issues a single SELECT regardless of row count."""
+        with mock_transactional_db:
+            executed_statements.clear()
+            result = await self.course_service.get_all_courses()
+
+        assert len(result.items) == len(multiple_courses)
+        assert len(_selects(executed_statements)) == 1
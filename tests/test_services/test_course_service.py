@@ -50,21 +50,23 @@ class TestCourseService:
         """Test get_all_courses method with empty database."""
         with mock_transactional_db:
             result = await self.course_service.get_all_courses()
-        
-        assert isinstance(result, list)
-        assert len(result) == 0
+
+        assert isinstance(result.items, list)
+        assert len(result.items) == 0
+        assert result.next_cursor is None
 
     @pytest.mark.unit
     async def test_get_all_courses_with_data(self, multiple_courses, mock_transactional_db):
         """Test get_all_courses method with existing courses."""
         with mock_transactional_db:
             result = await self.course_service.get_all_courses()
-        
-        assert isinstance(result, list)
-        assert len(result) == len(multiple_courses)
-        
+
+        assert isinstance(result.items, list)
+        assert len(result.items) == len(multiple_courses)
+        assert result.next_cursor == result.items[-1].id
+
         # Verify all courses have proper data
-        for course in result:
+        for course in result.items:
             assert hasattr(course, 'name')
             assert hasattr(course, 'author_name')
             assert hasattr(course, 'price')
@@ -278,10 +280,10 @@ class TestCourseService:
         from fastapi_playground_poc.courses_routes import get_all_courses
         
         with mock_transactional_db:
-            result = await get_all_courses(self.course_service)
-            
-            assert isinstance(result, list)
-            assert len(result) == len(multiple_courses)
+            result = await get_all_courses(course_service=self.course_service)
+
+            assert isinstance(result.items, list)
+            assert len(result.items) == len(multiple_courses)
 
     @pytest.mark.asyncio
     async def test_update_course_direct_route_success(self, test_db: AsyncSession, sample_course, mock_transactional_db):
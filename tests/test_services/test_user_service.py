@@ -67,6 +67,19 @@ class TestUserService:
             assert user.user_info is not None
             assert hasattr(user.user_info, 'address')
 
+    @pytest.mark.unit
+    async def test_get_user_blocks_lazy_loads(self, sample_user, mock_transactional_db):
+        """Test that raiseload('*') turns accidental lazy loads into errors."""
+        from sqlalchemy.exc import InvalidRequestError
+
+        with mock_transactional_db:
+            result = await self.user_service.get_user(sample_user.id)
+
+        # enrollments has no explicit loader option, so touching it must
+        # raise instead of silently issuing an N+1 query
+        with pytest.raises(InvalidRequestError):
+            _ = result.enrollments
+
     @pytest.mark.unit
     async def test_create_user_success(self, mock_transactional_db):
         """Test create_user method with valid data."""
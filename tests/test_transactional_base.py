@@ -37,10 +37,10 @@ async def async_generator_from_session(session):
 
 
 def mock_get_db_factory(session):
-    """Factory function that returns a fresh generator each time"""
-    def mock_get_db():
-        return async_generator_from_session(session)
-    return mock_get_db
+    """Factory standing in for AsyncSessionLocal that returns the given session"""
+    def mock_session_factory():
+        return session
+    return mock_session_factory
 
 
 def assert_sql_command_executed(mock_session, expected_sql):
@@ -116,7 +116,7 @@ class TestTransactionalDecoratorBase:
             assert isinstance(db, AsyncSession)
             return "success"
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             result = await test_func()
@@ -136,7 +136,7 @@ class TestTransactionalDecoratorBase:
         
         service = TestService()
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             result = await service.test_method()
@@ -152,7 +152,7 @@ class TestTransactionalDecoratorBase:
         async def test_func(db: AsyncSession):
             raise ValueError("Test exception")
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             with pytest.raises(ValueError):
@@ -171,7 +171,7 @@ class TestTransactionalDecoratorBase:
                 raise exception_type("Test exception")
             return "success"
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             # Test no exception
@@ -208,7 +208,7 @@ class TestPropagationBase:
             assert is_transaction_active()
             return "success"
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             assert not is_transaction_active()
@@ -230,7 +230,7 @@ class TestPropagationBase:
             result = await inner_func()
             return f"outer_{result}"
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             result = await outer_func()
@@ -249,7 +249,7 @@ class TestPropagationBase:
         async def outer_func(db: AsyncSession):
             return await inner_func()
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             result = await outer_func()
@@ -290,7 +290,7 @@ class TestPropagationBase:
         async def outer_func(db: AsyncSession):
             return await inner_func()
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             with pytest.raises(TransactionNotAllowedError):
@@ -309,7 +309,7 @@ class TestPropagationBase:
         async def outer_func(db: AsyncSession):
             return await inner_func()
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             result = await outer_func()
@@ -343,7 +343,7 @@ class TestPropagationBase:
             assert is_transaction_active()  # Transaction should be restored
             return result
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             result = await outer_func()
@@ -368,7 +368,7 @@ class TestNestedTransactionBase:
             result = await inner_service_method()
             return f"outer_{result}"
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             result = await outer_service_method()
@@ -387,7 +387,7 @@ class TestNestedTransactionBase:
             await failing_inner_method()
             return "should_not_reach"
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             with pytest.raises(ValueError):
@@ -410,7 +410,7 @@ class TestContextFunctionsBase:
             assert current_session is not None
             assert isinstance(current_session, AsyncSession)
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             await test_func()
@@ -431,7 +431,7 @@ class TestContextFunctionsBase:
         
         assert not is_transaction_active()
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             await test_func()
@@ -447,7 +447,7 @@ class TestContextFunctionsBase:
             mark_rollback_only()
             return "marked_for_rollback"
         
-        with patch('fastapi_playground_poc.transactional.get_db') as mock_get_db:
+        with patch('fastapi_playground_poc.transactional.AsyncSessionLocal') as mock_get_db:
             mock_get_db.side_effect = mock_get_db_factory(mock_session)
             
             result = await test_func()